@@ -2,21 +2,64 @@
 # Downloads ALL schedules from FFIEC, converts to Parquet with ZERO transformation.
 # No cleaning, no filtering, no data modification — pure passthrough.
 
+import multiprocessing
+import os
+import re
 import shutil
+import threading
 import time
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+from datetime import datetime, timedelta
 from pathlib import Path
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
 BULK_URL = "https://cdr.ffiec.gov/public/pws/downloadbulkdata.aspx"
 
 BASE_ZIP_DIR     = Path("data/raw/ffiec_zips")
-BASE_EXTRACT_DIR = Path("data/raw/ffiec_extracted")
 BASE_PARQUET_DIR = Path("data/raw/ffiec_parquet")
 
+# Any character that isn't safe in a filename becomes "_" (one per character)
+_SANITIZE_RE = re.compile(r"[^A-Za-z0-9]")
+
+# Explicit types for identifier columns when numeric typing is on
+# (preserve_strings=False); every other column's type is inferred.
+KNOWN_COLUMN_TYPES = {"IDRSSD": pa.int64()}
+
+# How long a scraped quarter list is trusted before FFIEC is asked again
+QUARTER_CACHE_TTL = timedelta(hours=6)
+
+# Quarters downloaded at once — downloads are network-bound, so a few in flight
+# keep the link busy while earlier quarters convert, without hammering FFIEC.
+MAX_CONCURRENT_DOWNLOADS = 3
+
+# Conversion workers are started with spawn, not fork: download and upload
+# threads are already running, and forking a threaded process can deadlock.
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+# ZSTD shrinks the files (and upload bytes) well below Snappy; dictionary
+# encoding collapses the highly repetitive IDRSSD / reporting_period columns.
+PARQUET_WRITE_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "use_dictionary": True,
+    "data_page_size": 1 << 20,
+    # Min/max per row group let readers skip groups when filtering on IDRSSD etc.
+    "write_statistics": True,
+}
+
+# Rows per Parquet row group (a few MB after encoding), so downstream readers
+# can fetch only the groups and columns they need over HTTP range requests
+ROW_GROUP_SIZE = 128 * 1024
+
 
 # ── Session ───────────────────────────────────────────────────────────────────
 
@@ -33,42 +76,67 @@ def _make_session() -> requests.Session:
         "Connection": "keep-alive",
         "Upgrade-Insecure-Requests": "1",
     })
+    # Each thread has its own session, so a couple of keep-alive connections is plenty
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=2)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+
+# Per-thread session, and the period form fetched on it once FFIEC needed one
+_local = threading.local()
+
+
+def _session() -> requests.Session:
+    """
+    This thread's keep-alive session, reused for the GET + postback + download of
+    every quarter the thread handles instead of new TLS handshakes.
+    requests.Session isn't documented as thread-safe, and separate sessions also
+    mean separate ASP.NET session cookies, so FFIEC doesn't serialize the
+    concurrent downloads behind one session lock.
+    """
+    s = getattr(_local, "session", None)
+    if s is None:
+        s = _local.session = _make_session()
     return s
 
 
 # ── ASP.NET form helpers ──────────────────────────────────────────────────────
 
-def _hidden_inputs(soup):
+def _text(el):
+    # Visible text with whitespace collapsed — same as XPath normalize-space()
+    return " ".join(el.text_content().split())
+
+def _hidden_inputs(tree):
     data = {}
     for name in ["__VIEWSTATE","__VIEWSTATEGENERATOR","__EVENTVALIDATION",
                  "__EVENTTARGET","__EVENTARGUMENT","__LASTFOCUS"]:
-        el = soup.find("input", {"name": name})
-        if el and el.get("value") is not None:
-            data[name] = el["value"]
+        values = tree.xpath("//input[@name=$n]/@value", n=name)
+        if values:
+            data[name] = values[0]
     data.setdefault("__EVENTTARGET", "")
     data.setdefault("__EVENTARGUMENT", "")
     data.setdefault("__LASTFOCUS", "")
     return data
 
-def _find_select_by_option_contains(soup, contains_text):
-    for sel in soup.find_all("select"):
-        if not sel.get("name"): continue
-        for opt in sel.find_all("option"):
-            if contains_text in opt.get_text(" ", strip=True):
-                return sel["name"]
+def _find_select_by_option_contains(tree, contains_text):
+    names = tree.xpath("//select[@name != ''][.//option[contains(normalize-space(.), $t)]]/@name",
+                       t=contains_text)
+    if names:
+        return names[0]
     raise RuntimeError(f"Could not find a <select> containing: {contains_text}")
 
-def _option_value_by_visible_text(soup, select_name, visible_text):
-    sel = soup.find("select", {"name": select_name})
+def _option_value_by_visible_text(tree, select_name, visible_text):
+    sel = tree.xpath("//select[@name=$s]", s=select_name)
     if not sel: raise RuntimeError(f"Select not found: {select_name}")
-    for opt in sel.find_all("option"):
-        if opt.get_text(" ", strip=True) == visible_text:
-            return opt.get("value")
-    sample = [o.get_text(" ", strip=True) for o in sel.find_all("option")[:20]]
+    opts = sel[0].xpath(".//option[normalize-space(.)=$t]", t=visible_text)
+    if opts:
+        return opts[0].get("value")
+    sample = [_text(o) for o in sel[0].xpath(".//option")[:20]]
     raise RuntimeError(f"'{visible_text}' not found in '{select_name}'. Sample: {sample}")
 
-def _option_value_match_period(soup, select_name, period_text):
-    sel = soup.find("select", {"name": select_name})
+def _option_value_match_period(tree, select_name, period_text):
+    sel = tree.xpath("//select[@name=$s]", s=select_name)
     if not sel: raise RuntimeError(f"Select not found: {select_name}")
     def norm(s):
         parts = s.strip().split("/")
@@ -78,39 +146,38 @@ def _option_value_match_period(soup, select_name, period_text):
             except: return s.strip()
         return s.strip()
     target_norm = norm(period_text.strip())
-    for opt in sel.find_all("option"):
-        txt = opt.get_text(" ", strip=True)
+    options = sel[0].xpath(".//option")
+    for opt in options:
+        txt = _text(opt)
         if txt == period_text.strip() or norm(txt) == target_norm:
             return txt, opt.get("value")
-    sample = [o.get_text(" ", strip=True) for o in sel.find_all("option")[:30]]
+    sample = [_text(o) for o in options[:30]]
     raise RuntimeError(f"Could not match '{period_text}'. Options: {sample}")
 
-def _find_tab_delimited_radio(soup):
-    for inp in soup.find_all("input", {"type": "radio"}):
-        name, value = inp.get("name"), inp.get("value")
-        if not name or value is None: continue
-        if "Tab Delimited" in inp.parent.get_text(" ", strip=True):
-            return name, value
-    for inp in soup.find_all("input", {"type": "radio"}):
-        rid, name, value = inp.get("id"), inp.get("name"), inp.get("value")
-        if not rid or not name or value is None: continue
-        lab = soup.find("label", {"for": rid})
-        if lab and "Tab Delimited" in lab.get_text(" ", strip=True):
-            return name, value
+def _find_tab_delimited_radio(tree):
+    radios = tree.xpath(
+        "//input[@type='radio'][@name != ''][@value]"
+        "[contains(normalize-space(..), 'Tab Delimited')]")
+    if not radios:
+        radios = tree.xpath(
+            "//input[@type='radio'][@id != ''][@name != ''][@value]"
+            "[@id = //label[contains(normalize-space(.), 'Tab Delimited')]/@for]")
+    if radios:
+        return radios[0].get("name"), radios[0].get("value")
     raise RuntimeError("Could not find 'Tab Delimited' radio button")
 
-def _find_download_submit(soup):
-    for btn in soup.find_all("input", {"type": "submit"}):
-        val = (btn.get("value") or "").strip().lower()
-        if val == "download" and btn.get("name"):
-            return btn["name"], btn.get("value", "Download")
-    btn = soup.find("input", {"type": "submit"})
-    if btn and btn.get("name"):
-        return btn["name"], btn.get("value", "Download")
+def _find_download_submit(tree):
+    btns = tree.xpath(
+        "//input[@type='submit'][@name != '']"
+        "[translate(normalize-space(@value), 'DOWNLOAD', 'download') = 'download']")
+    if not btns:
+        btns = tree.xpath("(//input[@type='submit'])[1][@name != '']")
+    if btns:
+        return btns[0].get("name"), btns[0].get("value", "Download")
     raise RuntimeError("Could not find Download button")
 
-def _postback_select_product(session, soup, product_select_name, product_val):
-    hidden = _hidden_inputs(soup)
+def _postback_select_product(session, tree, product_select_name, product_val):
+    hidden = _hidden_inputs(tree)
     payload = dict(hidden)
     payload[product_select_name] = product_val
     payload["__EVENTTARGET"] = product_select_name
@@ -120,64 +187,99 @@ def _postback_select_product(session, soup, product_select_name, product_val):
     time.sleep(0.8)
     r = session.post(BULK_URL, data=payload, headers=headers, timeout=60, allow_redirects=True)
     r.raise_for_status()
-    return BeautifulSoup(r.text, "lxml")
+    return lxml.html.fromstring(r.content)
+
+def _fetch_period_form(session):
+    """
+    Loads the bulk page and selects "Call Reports -- Single Period".
+    The resulting form is the same for every quarter, so one fetch is shared
+    by the whole run: (tree, product_select_name, product_val, period_select_name).
+    """
+    r = session.get(BULK_URL, timeout=60, allow_redirects=True)
+    r.raise_for_status()
+    tree = lxml.html.fromstring(r.content)
+    product_select_name = _find_select_by_option_contains(tree, "Call Reports -- Single Period")
+    product_val = _option_value_by_visible_text(tree, product_select_name, "Call Reports -- Single Period")
+    tree2 = _postback_select_product(session, tree, product_select_name, product_val)
+    period_selects = tree2.xpath("//select[@name != ''][.//option[contains(., '/')]]/@name")
+    if not period_selects:
+        raise RuntimeError("Could not locate period dropdown after product postback")
+    return tree2, product_select_name, product_val, period_selects[0]
 
 
 # ── Dynamic quarter detection ─────────────────────────────────────────────────
 
-def get_available_quarters(max_quarters: int = 12) -> list[str]:
+def get_available_quarters(max_quarters: int = 12, form=None) -> list[str]:
     """
     Scrapes FFIEC and returns available quarters, limited to most recent.
     
     Args:
         max_quarters: Maximum number of quarters to return (default 12 = 3 years)
+        form: Period form from _fetch_period_form(); fetched if not given
     """
     print("  Checking FFIEC for available quarters...")
-    with _make_session() as s:
-        r = s.get(BULK_URL, timeout=60, allow_redirects=True)
-        r.raise_for_status()
-        soup = BeautifulSoup(r.text, "lxml")
-        product_select_name = _find_select_by_option_contains(soup, "Call Reports -- Single Period")
-        product_val = _option_value_by_visible_text(soup, product_select_name, "Call Reports -- Single Period")
-        soup2 = _postback_select_product(s, soup, product_select_name, product_val)
-
-        for sel in soup2.find_all("select"):
-            if not sel.get("name"): continue
-            opts = [o.get_text(" ", strip=True) for o in sel.find_all("option")]
-            date_opts = [o for o in opts if o.count("/") == 2 and o.strip()]
-            if date_opts:
-                # FFIEC returns newest first, so [:max_quarters] gets most recent
-                limited = date_opts[:max_quarters]
-                print(f"  ✓ Found {len(date_opts)} total quarters on FFIEC")
-                print(f"  ✓ Limiting to most recent {len(limited)} quarters ({limited[-1]} to {limited[0]})")
-                return limited
+    tree2 = (form or _fetch_period_form(_session()))[0]
+
+    for sel in tree2.xpath("//select[@name != ''][.//option[contains(., '/')]]"):
+        opts = [_text(o) for o in sel.xpath(".//option")]
+        date_opts = [o for o in opts if o.count("/") == 2 and o.strip()]
+        if date_opts:
+            # FFIEC returns newest first, so [:max_quarters] gets most recent
+            limited = date_opts[:max_quarters]
+            print(f"  ✓ Found {len(date_opts)} total quarters on FFIEC")
+            print(f"  ✓ Limiting to most recent {len(limited)} quarters ({limited[-1]} to {limited[0]})")
+            return limited
     raise RuntimeError("Could not find any quarter options on FFIEC website")
 
 
-# ── Download / extract ────────────────────────────────────────────────────────
+def _available_quarters_cached(cache):
+    """
+    Returns (available quarters, period form or None). cache holds state.json's
+    last_ffiec_check / last_available and is updated in place.
+    Within QUARTER_CACHE_TTL of the last check no request is made at all; a
+    missing or invalid last_ffiec_check counts as stale.
+    """
+    now = datetime.now()
+    checked = cache.get("last_ffiec_check") if cache else None
+    if checked and cache.get("last_available"):
+        try:
+            fresh = now - datetime.fromisoformat(checked) < QUARTER_CACHE_TTL
+        except (TypeError, ValueError):
+            fresh = False   # unreadable timestamp — treat the cache as stale
+        if fresh:
+            print(f"  ✓ Using quarter list cached at {checked}")
+            return cache["last_available"], None
+
+    form = _fetch_period_form(_session())
+    available = get_available_quarters(form=form)
+
+    if cache is not None:
+        cache["last_ffiec_check"] = now.isoformat()
+        cache["last_available"] = available
+    return available, form
 
-def download_bulk_call_single_period(period_mmddyyyy, out_zip):
+
+# ── Download ──────────────────────────────────────────────────────────────────
+
+def download_bulk_call_single_period(period_mmddyyyy, out_zip, form=None):
     out_zip.parent.mkdir(parents=True, exist_ok=True)
-    with _make_session() as s:
-        r = s.get(BULK_URL, timeout=60, allow_redirects=True)
-        r.raise_for_status()
-        soup = BeautifulSoup(r.text, "lxml")
-        product_select_name = _find_select_by_option_contains(soup, "Call Reports -- Single Period")
-        product_val = _option_value_by_visible_text(soup, product_select_name, "Call Reports -- Single Period")
-        soup2 = _postback_select_product(s, soup, product_select_name, product_val)
-        period_select_name = None
-        for sel in soup2.find_all("select"):
-            if not sel.get("name"): continue
-            opts = [o.get_text(" ", strip=True) for o in sel.find_all("option")[:40]]
-            if any("/" in t for t in opts):
-                period_select_name = sel["name"]
-                break
-        if not period_select_name:
-            raise RuntimeError("Could not locate period dropdown after product postback")
-        chosen_text, period_val = _option_value_match_period(soup2, period_select_name, period_mmddyyyy)
-        format_name, format_val = _find_tab_delimited_radio(soup2)
-        download_name, download_val = _find_download_submit(soup2)
-        hidden2 = _hidden_inputs(soup2)
+    # The shared form was fetched on the main thread's session. If FFIEC won't
+    # accept its ViewState here, the retry below fetches one on this thread's
+    # session and keeps it, so the thread's later quarters start from that form.
+    s = _session()
+    form = getattr(_local, "form", None) or form
+    # Write to a .part file and rename when complete, so an interrupted download
+    # is never mistaken for a finished ZIP on the next run
+    part_zip = out_zip.with_name(out_zip.name + ".part")
+
+    for attempt in (1, 2):
+        if form is None:
+            form = _local.form = _fetch_period_form(s)
+        tree2, product_select_name, product_val, period_select_name = form
+        chosen_text, period_val = _option_value_match_period(tree2, period_select_name, period_mmddyyyy)
+        format_name, format_val = _find_tab_delimited_radio(tree2)
+        download_name, download_val = _find_download_submit(tree2)
+        hidden2 = _hidden_inputs(tree2)
         payload = dict(hidden2)
         payload[product_select_name] = product_val
         payload[period_select_name] = period_val
@@ -187,64 +289,231 @@ def download_bulk_call_single_period(period_mmddyyyy, out_zip):
                    "Content-Type": "application/x-www-form-urlencoded"}
         time.sleep(1.0)
         print(f"  Downloading {chosen_text}...")
-        dl = s.post(BULK_URL, data=payload, headers=headers, timeout=300, stream=True, allow_redirects=True)
-        dl.raise_for_status()
-        with open(out_zip, "wb") as f:
-            for chunk in dl.iter_content(chunk_size=1024 * 1024):
-                if chunk: f.write(chunk)
+        # Closing the response hands its connection back to the pool for the next quarter
+        with s.post(BULK_URL, data=payload, headers=headers, timeout=300, stream=True, allow_redirects=True) as dl:
+            # An expired __VIEWSTATE comes back as an error/HTML page instead of the ZIP
+            rejected = dl.status_code >= 400 or "text/html" in dl.headers.get("Content-Type", "")
+            if rejected and attempt == 1:
+                print(f"  ⚠ FFIEC rejected the cached form for {chosen_text} — refreshing")
+                form = None
+                continue
+            dl.raise_for_status()
+            if rejected:
+                raise RuntimeError(f"FFIEC returned an HTML page instead of the ZIP for {chosen_text}")
+            # Copy the socket stream to disk in C, 4 MB at a time
+            dl.raw.decode_content = True
+            with open(part_zip, "wb") as f:
+                shutil.copyfileobj(dl.raw, f, length=4 << 20)
+        break
+
+    part_zip.replace(out_zip)
     print(f"  ✓ Downloaded: {out_zip}")
     return out_zip
 
-def extract_zip(zip_path, out_dir):
-    out_dir.mkdir(parents=True, exist_ok=True)
-    with zipfile.ZipFile(zip_path, "r") as z:
-        z.extractall(out_dir)
-    print(f"  ✓ Extracted: {out_dir}")
-    return out_dir
-
 
 # ── Process ALL TSV files → Parquet (NO FILTERING, NO CLEANING) ──────────────
 
-def process_all_schedules(extract_dir: Path, quarter: str, out_dir: Path) -> list[Path]:
+def _parquet_path(out_dir: Path, member: str) -> Path:
+    # Use original filename as table identifier (strip .txt extension)
+    schedule_name = Path(member).stem  # e.g., "FFIEC CDR Call Schedule RC" → same name
+
+    # Sanitize filename for filesystem (replace spaces/special chars with underscores)
+    safe_name = _SANITIZE_RE.sub("_", schedule_name)
+    return out_dir / f"{safe_name}.parquet"
+
+
+def _is_valid_parquet(path: Path) -> bool:
+    """True if the file has a readable footer with rows, i.e. a finished conversion."""
+    try:
+        return pq.ParquetFile(path).metadata.num_rows > 0
+    except Exception:
+        return False
+
+
+def _pandas_types(first: pa.RecordBatch, has_descriptions: bool) -> dict:
     """
-    Converts EVERY .txt file in the extracted folder to Parquet.
-    ZERO transformation — pure passthrough of raw FFIEC data.
+    Column types where Arrow's inference would differ from what pandas.read_csv
+    wrote before: ints with blanks were float64 (NaN), dates stayed text.
     """
-    out_dir.mkdir(parents=True, exist_ok=True)
-    txt_files = list(extract_dir.glob("*.txt"))
-    
-    if not txt_files:
-        print(f"  ⚠ No .txt files in {extract_dir}")
+    types = {}
+    for field, col in zip(first.schema, first.columns):
+        if pa.types.is_temporal(field.type):
+            types[field.name] = pa.string()
+        elif pa.types.is_integer(field.type) and col.null_count:
+            types[field.name] = pa.float64()
+    if has_descriptions and "IDRSSD" in first.schema.names:
+        types["IDRSSD"] = pa.float64()   # the description row's blank cell made it NaN
+    return types
+
+
+def _schedule_columns(z: zipfile.ZipFile, member: str) -> tuple[list[str], bool, dict]:
+    """
+    Reads just the header of a TSV inside the ZIP. Also reports whether the first
+    data row is FFIEC's item-description row (schedules have one; its IDRSSD cell is blank),
+    and the pandas-compatible type overrides for the default mode (_pandas_types).
+    """
+    with z.open(member) as fh, pacsv.open_csv(
+        fh,
+        read_options=pacsv.ReadOptions(encoding="latin-1", block_size=1 << 20),
+        parse_options=pacsv.ParseOptions(delimiter="\t"),
+    ) as probe:
+        try:
+            first = probe.read_next_batch()
+        except StopIteration:
+            return probe.schema.names, False, {}
+        has_descriptions = first.num_rows > 0 and first.column(0)[0].as_py() in (None, "")
+        return probe.schema.names, has_descriptions, _pandas_types(first, has_descriptions)
+
+
+def _open_schedule(fh, names: list[str], preserve_strings: bool, has_descriptions: bool,
+                   pandas_types: dict, as_strings: bool = False) -> pacsv.CSVStreamingReader:
+    """
+    Opens an incremental TSV reader that yields one block at a time.
+
+    preserve_strings=True writes what pandas.read_csv did before: the description
+    row is kept, types are inferred (with pandas_types applied) and blanks are null.
+    Otherwise numeric columns get native int/float types (much smaller Parquet):
+    the description row is skipped and IDRSSD is int64.
+    as_strings=True reads every column as raw text (the last-resort fallback).
+    """
+    if as_strings:
+        skip_rows = 0
+        convert_options = pacsv.ConvertOptions(
+            column_types={n: pa.string() for n in names},
+            strings_can_be_null=True,
+        )
+    elif preserve_strings:
+        skip_rows = 0
+        convert_options = pacsv.ConvertOptions(
+            column_types=pandas_types,
+            strings_can_be_null=True,
+        )
+    else:
+        skip_rows = 1 if has_descriptions else 0
+        convert_options = pacsv.ConvertOptions(
+            column_types={n: t for n, t in KNOWN_COLUMN_TYPES.items() if n in names},
+            null_values=["", "NA"],
+            strings_can_be_null=True,
+        )
+    return pacsv.open_csv(
+        fh,
+        read_options=pacsv.ReadOptions(encoding="latin-1", block_size=32 << 20,
+                                       skip_rows_after_names=skip_rows),
+        parse_options=pacsv.ParseOptions(delimiter="\t"),
+        convert_options=convert_options,
+    )
+
+
+def _write_schedule(zip_path: Path, member: str, quarter: str, out_path: Path,
+                    preserve_strings: bool, as_strings: bool = False) -> int:
+    with zipfile.ZipFile(zip_path) as z:
+        names, has_descriptions, pandas_types = _schedule_columns(z, member)
+
+        with z.open(member) as fh, _open_schedule(fh, names, preserve_strings, has_descriptions,
+                                                      pandas_types, as_strings) as reader:
+            # All-blank columns are stored as float64 (all NaN), as pandas did
+            fields = [f.with_type(pa.float64()) if pa.types.is_null(f.type) else f
+                      for f in reader.schema]
+            # Only add reporting_period column — everything else untouched.
+            # A one-entry dictionary broadcast per batch: no per-row strings.
+            period = pa.scalar(quarter, pa.dictionary(pa.int32(), pa.string()))
+            schema = pa.schema(fields + [pa.field("reporting_period", period.type)])
+            rows = 0
+            with pq.ParquetWriter(out_path, schema, **PARQUET_WRITE_OPTIONS) as writer:
+                for batch in reader:
+                    columns = [c.cast(f.type) if c.type != f.type else c
+                               for c, f in zip(batch.columns, fields)]
+                    writer.write_batch(pa.RecordBatch.from_arrays(
+                        columns + [pa.repeat(period, batch.num_rows)], schema=schema),
+                        row_group_size=ROW_GROUP_SIZE)
+                    rows += batch.num_rows
+    return rows
+
+
+def _convert_one(zip_path: Path, member: str, quarter: str, out_dir: Path,
+                 preserve_strings: bool = True):
+    """
+    Streams a single TSV straight out of the ZIP into Parquet, batch-by-batch.
+    Runs inside a worker process. The .txt is never written to disk, and memory
+    is bounded by one read block, not by the size of the file.
+    Returns (out_path, row_count, fell_back_to_strings), or the exception if the file failed.
+    """
+    out_path = _parquet_path(out_dir, member)
+
+    try:
+        try:
+            return out_path, _write_schedule(zip_path, member, quarter, out_path, preserve_strings), False
+        except pa.ArrowInvalid:
+            # Types are inferred from the first block only; a later value that
+            # doesn't fit means this file has to be written entirely as raw strings.
+            return out_path, _write_schedule(zip_path, member, quarter, out_path, preserve_strings,
+                                             as_strings=True), True
+
+    except Exception as e:
+        # Don't leave a truncated file behind that looks like a finished schedule
+        out_path.unlink(missing_ok=True)
+        return e
+
+
+def _conversion_pool(max_workers=None) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1,
+                               mp_context=_MP_CONTEXT)
+
+
+def process_all_schedules(zip_path: Path, quarter: str, out_dir: Path,
+                          on_written=None, preserve_strings: bool = True,
+                          executor: ProcessPoolExecutor | None = None) -> list[Path]:
+    """
+    Converts EVERY .txt file in the quarter's ZIP to Parquet.
+    ZERO transformation — pure passthrough of raw FFIEC data — unless
+    preserve_strings=False, which stores numeric columns as native types.
+    Files are independent, so they are converted in parallel across CPU cores,
+    in executor if given (one pool shared by every quarter) or a pool of its own.
+    on_written(path) is called as each file finishes, while the rest still convert.
+    """
+    with zipfile.ZipFile(zip_path) as z:
+        members = [info.filename for info in z.infolist() if info.filename.endswith(".txt")]
+
+    if not members:
+        print(f"  ⚠ No .txt files in {zip_path}")
         return []
 
-    print(f"  Found {len(txt_files)} schedule files to process")
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    print(f"  Found {len(members)} schedule files to process")
     written = []
 
-    for txt_file in txt_files:
-        # Use original filename as table identifier (strip .txt extension)
-        schedule_name = txt_file.stem  # e.g., "FFIEC CDR Call Schedule RC" → same name
-        
-        try:
-            # Read TSV exactly as-is, no transformations
-            df = pd.read_csv(txt_file, sep="\t", low_memory=False, encoding="latin-1")
-            
-            # Only add reporting_period column — everything else untouched
-            df["reporting_period"] = quarter
-            
-            # Sanitize filename for filesystem (replace spaces/special chars with underscores)
-            safe_name = "".join(c if c.isalnum() else "_" for c in schedule_name)
-            out_path = out_dir / f"{safe_name}.parquet"
-            
-            # Write raw data to Parquet
-            df.to_parquet(out_path, index=False)
+    # Resume per file: anything a previous (possibly crashed) run already
+    # finished is kept; only missing or truncated files are converted again.
+    pending = []
+    for member in members:
+        out_path = _parquet_path(out_dir, member)
+        if out_path.exists() and _is_valid_parquet(out_path):
+            written.append(out_path)
+        else:
+            pending.append(member)
+    if written:
+        print(f"  ✓ {len(written)} already converted, {len(pending)} remaining")
+    if not pending:
+        return written
+
+    pool = nullcontext(executor) if executor else _conversion_pool(min(len(pending), os.cpu_count() or 1))
+    with pool as executor:
+        futures = {executor.submit(_convert_one, zip_path, m, quarter, out_dir, preserve_strings): m for m in pending}
+        for future in as_completed(futures):
+            member, result = futures[future], future.result()
+            if isinstance(result, Exception):
+                print(f"  ✗ Error processing {member}: {result}")
+                # Continue processing other files even if one fails
+                continue
+            out_path, rows, fell_back = result
             written.append(out_path)
-            
-            print(f"  ✓ {txt_file.name} → {out_path.name} ({len(df):,} rows)")
-            del df
-            
-        except Exception as e:
-            print(f"  ✗ Error processing {txt_file.name}: {e}")
-            # Continue processing other files even if one fails
+            print(f"  ✓ {member} → {out_path.name} ({rows:,} rows)")
+            if fell_back:
+                print(f"  ⚠ {out_path.name} written entirely as raw strings, description row kept "
+                      "(a value didn't fit its column's type) — its schema differs from the quarter's other files")
+            if on_written:
+                on_written(out_path)
 
     return written
 
@@ -252,30 +521,46 @@ def process_all_schedules(extract_dir: Path, quarter: str, out_dir: Path) -> lis
 # ── Cleanup ───────────────────────────────────────────────────────────────────
 
 def cleanup_quarter_staging(quarter_slug: str):
-    """Deletes ZIP + extracted folder after successful upload."""
-    zip_path    = BASE_ZIP_DIR / f"call_{quarter_slug}.zip"
-    extract_dir = BASE_EXTRACT_DIR / quarter_slug
+    """Deletes the downloaded ZIP after successful upload."""
+    zip_path = BASE_ZIP_DIR / f"call_{quarter_slug}.zip"
     if zip_path.exists():
         zip_path.unlink()
         print(f"  🗑  Deleted ZIP: {zip_path}")
-    if extract_dir.exists():
-        shutil.rmtree(extract_dir)
-        print(f"  🗑  Deleted extracted folder: {extract_dir}")
 
 
 # ── Main entry point ──────────────────────────────────────────────────────────
 
-def download_and_process_new_quarters(already_processed: set) -> list[str]:
+def _download_quarter(quarter: str, form) -> Path:
+    """Downloads one quarter's ZIP unless it's already staged. Runs in a download thread."""
+    zip_path = BASE_ZIP_DIR / f"call_{quarter.replace('/', '-')}.zip"
+    if zip_path.exists():
+        print(f"  ✓ ZIP already exists: {zip_path}")
+        return zip_path
+    return download_bulk_call_single_period(quarter, zip_path, form)
+
+
+def download_and_process_new_quarters(already_processed: set, on_written=None,
+                                      preserve_strings: bool = True,
+                                      ffiec_cache: dict | None = None) -> list[str]:
     """
     Downloads and converts ALL schedules from new quarters.
+    preserve_strings=False stores numeric columns as native types (see _open_schedule).
+    ffiec_cache (persisted by the caller) lets a recent quarter check skip the scrape.
+    on_written(quarter_slug, path) is called for each Parquet file as soon as it's
+    written, so callers can start uploading before the quarter is finished.
     Returns list of newly processed quarter slugs.
     """
     print("=" * 70)
     print("STEP 1 — FFIEC Extractor: Checking for new quarters")
     print("=" * 70)
 
-    available    = list(reversed(get_available_quarters()))  # oldest → newest
-    new_quarters = [q for q in available if q.replace("/", "-") not in already_processed]
+    # One landing-page GET + product postback, shared by the scrape and every
+    # download — or none at all while the cached quarter list is fresh
+    available, form = _available_quarters_cached(ffiec_cache)
+    available    = list(reversed(available))  # oldest → newest
+    # Slug each FFIEC date once ("03/31/2024" → "03-31-2024", the state/storage form)
+    slugs        = {q: q.replace("/", "-") for q in available}
+    new_quarters = [q for q in available if slugs[q] not in already_processed]
 
     if not new_quarters:
         print("\n✓ All quarters already downloaded.\n")
@@ -286,43 +571,60 @@ def download_and_process_new_quarters(already_processed: set) -> list[str]:
         print(f"  • {q}")
     print()
 
-    newly_done = []
-
-    for idx, quarter in enumerate(new_quarters, 1):
-        print(f"\n[{idx}/{len(new_quarters)}] {quarter}")
-        q_slug      = quarter.replace("/", "-")
-        zip_path    = BASE_ZIP_DIR / f"call_{q_slug}.zip"
-        extract_dir = BASE_EXTRACT_DIR / q_slug
-        parquet_dir = BASE_PARQUET_DIR / q_slug
-
-        if not zip_path.exists():
-            try:
-                download_bulk_call_single_period(quarter, zip_path)
-            except Exception as e:
-                print(f"  ✗ Download failed: {e}")
-                continue
-        else:
-            print("  ✓ ZIP already exists")
+    if form is None:
+        form = _fetch_period_form(_session())
 
-        if not extract_dir.exists():
-            try:
-                extract_zip(zip_path, extract_dir)
-            except Exception as e:
-                print(f"  ✗ Extract failed: {e}")
-                continue
-        else:
-            print("  ✓ Already extracted")
-
-        if not parquet_dir.exists():
-            written = process_all_schedules(extract_dir, quarter, parquet_dir)
-            if not written:
-                print("  ⚠ No files processed — skipping")
-                continue
-        else:
-            print("  ✓ Parquet already exists")
+    newly_done = []
 
-        newly_done.append(q_slug)
-        time.sleep(1.5)
+    # Downloads run in background threads; each quarter is converted here as
+    # soon as its ZIP lands (whichever finishes first, while it's still in the
+    # OS page cache), overlapping CPU work with the remaining downloads.
+    # One conversion pool serves every quarter, so workers start only once.
+    converters = _conversion_pool()
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS) as pool:
+            downloads = {pool.submit(_download_quarter, q, form): q for q in new_quarters}
+
+            for idx, future in enumerate(as_completed(downloads), 1):
+                quarter     = downloads[future]
+                print(f"\n[{idx}/{len(new_quarters)}] {quarter}")
+                q_slug      = slugs[quarter]
+                parquet_dir = BASE_PARQUET_DIR / q_slug
+
+                try:
+                    zip_path = future.result()
+                except Exception as e:
+                    print(f"  ✗ Download failed: {e}")
+                    continue
+
+                try:
+                    written = process_all_schedules(
+                        zip_path, quarter, parquet_dir,
+                        on_written=(lambda fp: on_written(q_slug, fp)) if on_written else None,
+                        preserve_strings=preserve_strings,
+                        executor=converters,
+                    )
+                except zipfile.BadZipFile as e:
+                    print(f"  ✗ Extract failed: {e}")
+                    continue
+                except BrokenProcessPool as e:
+                    # A worker was killed (OOM, segfault). Files it had finished are
+                    # kept and resumed next run; later quarters get a fresh pool.
+                    print(f"  ✗ Conversion worker died: {e} — restarting conversion pool")
+                    converters.shutdown(wait=False, cancel_futures=True)
+                    converters = _conversion_pool()
+                    continue
+                if not written:
+                    print("  ⚠ No files processed — skipping")
+                    continue
+
+                newly_done.append(q_slug)
+    finally:
+        converters.shutdown()
+
+    # Hand quarters to the uploader oldest → newest, regardless of download order
+    order = {slugs[q]: i for i, q in enumerate(new_quarters)}
+    newly_done.sort(key=order.__getitem__)
 
     print(f"\n✓ {len(newly_done)} quarter(s) ready for upload.")
     return newly_done
@@ -1,17 +1,25 @@
 # pipeline.py - Orchestrates FFIEC → Supabase pipeline
 # This is what run.bat / run.sh calls.
 
-import json
 import logging
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
 from extractor import download_and_process_new_quarters
-from uploader import upload_quarters
+from uploader import MAX_UPLOAD_WORKERS, make_client, upload_parquet_file, upload_quarters
 
 STATE_FILE = Path("state.json")
 LOG_FILE   = Path("ffiec_pipeline.log")
 
+# FFIEC_NATIVE_TYPES=1 stores numeric columns as native int/float types
+# (much smaller files, but a different schema from raw-string quarters)
+PRESERVE_STRINGS = os.environ.get("FFIEC_NATIVE_TYPES", "").lower() not in ("1", "true", "yes")
+
 # ── Logging ───────────────────────────────────────────────────────────────────
 logging.basicConfig(
     level=logging.INFO,
@@ -28,17 +36,16 @@ log = logging.getLogger(__name__)
 
 def load_state() -> dict:
     if STATE_FILE.exists():
-        with open(STATE_FILE) as f:
-            return json.load(f)
+        return orjson.loads(STATE_FILE.read_bytes())
     return {"uploaded_quarters": [], "last_run": None}
 
 
-def save_state(uploaded_quarters: list[str]):
-    with open(STATE_FILE, "w") as f:
-        json.dump({
-            "uploaded_quarters": sorted(uploaded_quarters),
-            "last_run": datetime.now().isoformat(),
-        }, f, indent=2)
+def save_state(uploaded_quarters: set[str], ffiec_cache: dict | None = None):
+    STATE_FILE.write_bytes(orjson.dumps({
+        **(ffiec_cache or {}),
+        "uploaded_quarters": sorted(uploaded_quarters),
+        "last_run": datetime.now().isoformat(),
+    }, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
     log.info(f"State saved. Total quarters in Supabase: {len(uploaded_quarters)}")
 
 
@@ -53,20 +60,48 @@ def run():
     state    = load_state()
     uploaded = set(state.get("uploaded_quarters", []))
     log.info(f"Quarters already in Supabase: {len(uploaded)}")
-
-    # Step 1: Download + convert any new quarters to Parquet
-    newly_extracted = download_and_process_new_quarters(already_processed=uploaded)
+    if not PRESERVE_STRINGS:
+        log.info("FFIEC_NATIVE_TYPES is set — numeric columns stored as native types")
+
+    # The extractor's cache of the last FFIEC quarter check (an old ffiec_etag key is dropped)
+    ffiec_cache = {k: state[k] for k in ("last_ffiec_check", "last_available") if k in state}
+
+    # Each Parquet file is queued for upload as soon as it's converted, so
+    # uploads run in background threads while Step 1 keeps converting.
+    # Anything that fails here is retried in Step 2.
+    s3    = make_client()
+    early = {}   # upload future → (quarter slug, file)
+
+    with ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as upload_pool:
+        def upload_as_written(q_slug, fp):
+            early[upload_pool.submit(upload_parquet_file, s3, q_slug, fp)] = (q_slug, fp)
+
+        # Step 1: Download + convert any new quarters to Parquet
+        newly_extracted = download_and_process_new_quarters(
+            already_processed=uploaded, on_written=upload_as_written,
+            preserve_strings=PRESERVE_STRINGS, ffiec_cache=ffiec_cache,
+        )
+
+    # Every early upload has finished; only confirmed ones are skipped in Step 2
+    streamed = defaultdict(set)   # quarter slug → file names already in Supabase
+    for future, (q_slug, fp) in early.items():
+        try:
+            future.result()
+            streamed[q_slug].add(fp.name)
+        except Exception as e:
+            log.warning(f"Early upload of {fp.name} failed, will retry in Step 2: {e}")
 
     if not newly_extracted:
+        save_state(uploaded, ffiec_cache)
         log.info("Nothing new to upload. Pipeline complete.")
         return
 
-    # Step 2: Upload new Parquet files to Supabase
-    newly_uploaded = upload_quarters(newly_extracted)
+    # Step 2: Upload whatever Parquet files Step 1 didn't already send
+    newly_uploaded = upload_quarters(newly_extracted, s3=s3, already_uploaded=streamed)
 
     # Step 3: Save updated state
-    all_uploaded = sorted(uploaded | set(newly_uploaded))
-    save_state(all_uploaded)
+    all_uploaded = uploaded.union(newly_uploaded)   # save_state sorts on write
+    save_state(all_uploaded, ffiec_cache)
 
     log.info("=" * 60)
     log.info(f"Pipeline complete. {len(newly_uploaded)} new quarter(s) in Supabase.")
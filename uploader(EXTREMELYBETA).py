@@ -1,31 +1,81 @@
 # uploader.py
-# Upload raw parquet files to Supabase Storage
+# Upload raw parquet files to Supabase Storage (via its S3-compatible endpoint)
 # ZERO transformation — uploads files exactly as extracted.
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from supabase import create_client
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from dotenv import load_dotenv
 
 # ── Load environment variables ────────────────────────────────────────────────
 load_dotenv()
 
 SUPABASE_URL = os.environ["SUPABASE_URL"]
-SUPABASE_KEY = os.environ["SUPABASE_SERVICE_ROLE_KEY"]
+# S3 access keys: Supabase dashboard → Project Settings → Storage → S3 Connection
+S3_ACCESS_KEY_ID     = os.environ["SUPABASE_S3_ACCESS_KEY_ID"]
+S3_SECRET_ACCESS_KEY = os.environ["SUPABASE_S3_SECRET_ACCESS_KEY"]
+S3_REGION            = os.environ.get("SUPABASE_S3_REGION", "us-east-1")
 BUCKET = os.environ.get("SUPABASE_BUCKET", "ffiec-raw")
 
 BASE_PARQUET_DIR = Path("data/raw/ffiec_parquet")
 
+# Uploads are latency-bound HTTPS requests, so several files go at once per quarter
+MAX_UPLOAD_WORKERS = 8
+
+# Files over 64 MB are sent as multipart uploads, 8 parts in parallel
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=64 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True,
+)
+
+
+# ── Client ────────────────────────────────────────────────────────────────────
+
+def make_client():
+    return boto3.client(
+        "s3",
+        endpoint_url=f"{SUPABASE_URL}/storage/v1/s3",
+        aws_access_key_id=S3_ACCESS_KEY_ID,
+        aws_secret_access_key=S3_SECRET_ACCESS_KEY,
+        region_name=S3_REGION,
+        config=Config(
+            s3={"addressing_style": "path"},
+            # Enough pooled connections for every file thread × its multipart parts
+            max_pool_connections=MAX_UPLOAD_WORKERS * TRANSFER_CONFIG.max_request_concurrency,
+        ),
+    )
+
 
 # ── Upload a single quarter ───────────────────────────────────────────────────
 
-def upload_quarter_to_storage(quarter_slug: str) -> int:
+def upload_parquet_file(s3, quarter_slug: str, fp: Path) -> str:
     """
-    Upload all parquet files for one quarter to Supabase Storage.
-    Returns number of files uploaded.
+    Uploads one parquet file (overwriting any existing object). Runs in an upload
+    thread — Step 2's pool, or pipeline.py's while Step 1 is still converting.
     """
-    sb = create_client(SUPABASE_URL, SUPABASE_KEY)
+    remote_path = f"call_reports/{quarter_slug}/{fp.name}"
+
+    s3.upload_file(
+        str(fp), BUCKET, remote_path,
+        ExtraArgs={"ContentType": "application/octet-stream"},
+        Config=TRANSFER_CONFIG,
+    )
+
+    print(f"☁️  {fp.name} → {remote_path}")
+    return remote_path
 
+
+def upload_quarter_to_storage(s3, quarter_slug: str, already_uploaded=frozenset()) -> int:
+    """
+    Upload all parquet files for one quarter to Supabase Storage, skipping
+    file names in already_uploaded (sent during Step 1).
+    Files are uploaded in parallel; any failure fails the quarter.
+    Returns number of the quarter's files now in storage.
+    """
     qdir = BASE_PARQUET_DIR / quarter_slug
     files = sorted(qdir.glob("*.parquet"))
 
@@ -33,37 +83,36 @@ def upload_quarter_to_storage(quarter_slug: str) -> int:
         print(f"⚠ No parquet files for {quarter_slug}")
         return 0
 
-    uploaded = 0
+    pending = [fp for fp in files if fp.name not in already_uploaded]
+    if len(pending) < len(files):
+        print(f"✓ {len(files) - len(pending)} file(s) already uploaded during extraction")
 
-    for fp in files:
-        remote_path = f"call_reports/{quarter_slug}/{fp.name}"
+    uploaded = len(files) - len(pending)
+    failed = []
 
-        try:
-            with open(fp, "rb") as f:
-                sb.storage.from_(BUCKET).upload(
-                    path=remote_path,
-                    file=f,
-                    file_options={
-                        "upsert": "true",
-                        "content-type": "application/octet-stream",
-                    },
-                )
-
-            uploaded += 1
-            print(f"☁️  {fp.name} → {remote_path}")
+    with ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as executor:
+        futures = [executor.submit(upload_parquet_file, s3, quarter_slug, fp) for fp in pending]
 
-        except Exception as e:
-            print(f"✗ Failed uploading {fp.name}: {e}")
-            raise
+        for fp, future in zip(pending, futures):
+            try:
+                future.result()
+                uploaded += 1
+            except Exception as e:
+                print(f"✗ Failed uploading {fp.name}: {e}")
+                failed.append(fp.name)
+
+    if failed:
+        raise RuntimeError(f"{len(failed)} of {len(files)} file(s) failed to upload: {failed}")
 
     return uploaded
 
 
 # ── Wrapper used by pipeline.py ───────────────────────────────────────────────
 
-def upload_quarters(quarter_slugs: list[str]) -> list[str]:
+def upload_quarters(quarter_slugs: list[str], s3=None, already_uploaded=None) -> list[str]:
     """
     Upload multiple quarters to Supabase Storage.
+    already_uploaded maps quarter slug → file names streamed up during Step 1.
     Returns list of successfully uploaded quarter slugs.
     """
     if not quarter_slugs:
@@ -75,13 +124,16 @@ def upload_quarters(quarter_slugs: list[str]) -> list[str]:
     print("=" * 70)
     print(f"Quarters to upload: {quarter_slugs}\n")
 
+    # One client (and its pooled HTTP connections) for every quarter in the run
+    s3 = s3 or make_client()
+    already_uploaded = already_uploaded or {}
     successful = []
 
     for q in quarter_slugs:
         print(f"\n── {q} ──────────────────────────────────────────────")
 
         try:
-            n = upload_quarter_to_storage(q)
+            n = upload_quarter_to_storage(s3, q, already_uploaded.get(q, frozenset()))
 
             if n > 0:
                 successful.append(q)